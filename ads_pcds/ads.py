@@ -1,13 +1,16 @@
+import collections
 import ctypes
 import enum
+import functools
+import heapq
 import logging
-import queue
 import struct
 import threading
 import time
 
+import numpy as np
 import pyads
-from pyads import structs, constants
+from pyads import structs, constants, pyads_ex
 
 
 logger = logging.getLogger(__name__)
@@ -63,49 +66,127 @@ def get_symbol_information(plc, symbol_name) -> structs.SAdsSymbolEntry:
     )
 
 
-def unpack_notification(notification, plc_datatype):
-    contents = notification.contents
-    data_size = contents.cbSampleSize
-    # Get dynamically sized data array
-    data = (ctypes.c_ubyte * data_size).from_address(
-        ctypes.addressof(contents) +
-        structs.SAdsNotificationHeader.data.offset)
-
-    datatype_map = {
-        constants.PLCTYPE_BOOL: "<?",
-        constants.PLCTYPE_BYTE: "<c",
-        constants.PLCTYPE_DINT: "<i",
-        constants.PLCTYPE_DWORD: "<I",
-        constants.PLCTYPE_INT: "<h",
-        constants.PLCTYPE_LREAL: "<d",
-        constants.PLCTYPE_REAL: "<f",
-        constants.PLCTYPE_SINT: "<b",
-        constants.PLCTYPE_UDINT: "<L",
-        constants.PLCTYPE_UINT: "<H",
-        constants.PLCTYPE_USINT: "<B",
-        constants.PLCTYPE_WORD: "<H",
-    }
+# Integer types: (size, signed), decoded with int.from_bytes
+_NOTIFICATION_INTS = {
+    constants.PLCTYPE_BYTE: (1, False),
+    constants.PLCTYPE_DINT: (4, True),
+    constants.PLCTYPE_DWORD: (4, False),
+    constants.PLCTYPE_INT: (2, True),
+    constants.PLCTYPE_LINT: (8, True),
+    constants.PLCTYPE_SINT: (1, True),
+    constants.PLCTYPE_UDINT: (4, False),
+    constants.PLCTYPE_UINT: (2, False),
+    constants.PLCTYPE_ULINT: (8, False),
+    constants.PLCTYPE_USINT: (1, False),
+    constants.PLCTYPE_WORD: (2, False),
+}
+
+# Remaining primitive types, decoded with pre-built structs
+_NOTIFICATION_STRUCTS = {
+    constants.PLCTYPE_BOOL: struct.Struct("<?"),
+    constants.PLCTYPE_LREAL: struct.Struct("<d"),
+    constants.PLCTYPE_REAL: struct.Struct("<f"),
+}
+
+
+# Windows FILETIME (100 ns intervals since 1601-01-01) of the UNIX epoch
+_FILETIME_UNIX_EPOCH = 116444736000000000
+
+
+def filetime_to_timestamp(filetime):
+    'Convert a Windows FILETIME to a UNIX timestamp, as in time.time()'
+    return (filetime - _FILETIME_UNIX_EPOCH) / 10_000_000
+
+
+# Offset of the sample data from the start of the notification header
+_NOTIFICATION_DATA_OFFSET = structs.SAdsNotificationHeader.data.offset
+
+
+def get_notification_decoder(plc_datatype):
+    """
+    Get a decoder for notification samples of the given data type.
+
+    The decoder takes the sample data, copied out of the notification as
+    bytes, and returns its value.  Arrays of primitive types are decoded to
+    (read-only) numpy arrays.
+    """
+    if plc_datatype in _NOTIFICATION_INTS:
+        _, signed = _NOTIFICATION_INTS[plc_datatype]
+
+        def decode_int(data):
+            return int.from_bytes(data, 'little', signed=signed)
+
+        return decode_int
+
+    if plc_datatype in _NOTIFICATION_STRUCTS:
+        unpack_from = _NOTIFICATION_STRUCTS[plc_datatype].unpack_from
+
+        def decode_primitive(data):
+            return unpack_from(data)[0]
+
+        return decode_primitive
 
     if plc_datatype == constants.PLCTYPE_STRING:
-        # read only until null-termination character
-        value = bytearray(data).split(b"\0", 1)[0].decode("utf-8")
-
-    elif issubclass(plc_datatype, ctypes.Structure):
-        value = plc_datatype()
-        fit_size = min(data_size, ctypes.sizeof(value))
-        ctypes.memmove(ctypes.addressof(value), ctypes.addressof(data),
-                       fit_size)
-    elif plc_datatype not in datatype_map:
-        value = bytearray(data)
+        def decode_string(data):
+            # read only until null-termination character
+            return data.split(b"\0", 1)[0].decode("utf-8")
+
+        return decode_string
+
+    if issubclass(plc_datatype, ctypes.Structure):
+        def decode_structure(data):
+            # Samples may be shorter than the structure
+            value = plc_datatype()
+            ctypes.memmove(ctypes.addressof(value), data,
+                           min(len(data), ctypes.sizeof(value)))
+            return value
+
+        return decode_structure
+
+    if issubclass(plc_datatype, ctypes.Array):
+        base_type = plc_datatype._type_
+        if base_type in _NOTIFICATION_INTS or \
+                base_type in _NOTIFICATION_STRUCTS:
+            dtype = np.dtype(base_type).newbyteorder('<')
+
+            def decode_array(data):
+                return np.frombuffer(data, dtype=dtype)
+
+            return decode_array
+
+    def decode_raw(data):
+        return data
+
+    return decode_raw
+
+
+def unpack_notification(notification, plc_datatype, *, as_datetime=False):
+    """
+    Unpack a notification of the given data type to (timestamp, value).
+
+    The timestamp is a UNIX timestamp, as in time.time(), or a datetime if
+    `as_datetime` is set.
+    """
+    contents = notification.contents
+    data = ctypes.string_at(
+        ctypes.addressof(contents) + _NOTIFICATION_DATA_OFFSET,
+        contents.cbSampleSize)
+    if as_datetime:
+        timestamp = pyads.filetimes.filetime_to_dt(contents.nTimeStamp)
     else:
-        value, = struct.unpack(datatype_map[plc_datatype], bytearray(data))
+        timestamp = filetime_to_timestamp(contents.nTimeStamp)
+    return timestamp, get_notification_decoder(plc_datatype)(data)
+
 
-    timestamp = pyads.filetimes.filetime_to_dt(contents.nTimeStamp)
-    return timestamp, value
+@functools.lru_cache(maxsize=1024)
+def _array_of(data_type, array_length):
+    'Get the (cached) ctypes array type of `array_length` `data_type`s'
+    return data_type * array_length
 
 
-def get_symbol_data_type(plc, symbol_name, *, custom_types=None):
-    info = get_symbol_information(plc, symbol_name)
+def get_symbol_data_type(plc, symbol_name, *, custom_types=None, info=None):
+    if info is None:
+        info = get_symbol_information(plc, symbol_name)
     type_name = info.type_name
     data_type_int = info.dataType
 
@@ -139,7 +220,7 @@ def get_symbol_data_type(plc, symbol_name, *, custom_types=None):
         # size, it is an array of that type:
         array_length = info.size // ctypes.sizeof(data_type)
         if array_length > 1:
-            data_type = data_type * array_length
+            data_type = _array_of(data_type, array_length)
 
     return data_type, array_length
 
@@ -156,52 +237,133 @@ def enumerate_plc_symbols(plc):
                  ctypes.c_ubyte * symbol_info.nSymSize,
                  return_ctypes=True))
 
-    symbol_buffer = bytearray(symbol_buffer)
+    # Entries are variable-length and may be shorter than the full
+    # SAdsSymbolEntry structure; pad once so that the final entry can be
+    # mapped in-place.
+    buffer_size = len(symbol_buffer)
+    symbol_buffer += bytearray(ctypes.sizeof(structs.SAdsSymbolEntry))
 
     symbols = {}
-    while symbol_buffer:
-        if len(symbol_buffer) < ctypes.sizeof(structs.SAdsSymbolEntry):
-            symbol_buffer += (bytearray(ctypes.sizeof(structs.SAdsSymbolEntry)
-                                        - len(symbol_buffer)))
-        entry = structs.SAdsSymbolEntry.from_buffer(symbol_buffer)
+    offset = 0
+    while offset < buffer_size:
+        entry = structs.SAdsSymbolEntry.from_buffer(symbol_buffer, offset)
         if entry.entryLength == 0:
             break
 
         symbols[entry.name] = {'entry': entry,
                                'type': entry.type_name,
                                'comment': entry.comment}
-        symbol_buffer = symbol_buffer[entry.entryLength:]
+        offset += entry.entryLength
 
     return symbols
 
 
+# ADS limit on the number of sub-commands in one sum-up request
+_SUM_READ_MAX = 500
+
+# Per-item error code at the start of a sum-up read response
+_SUM_READ_ERROR = struct.Struct('<I')
+
+# Raw sum-up reads (pyads 3.3.9+); without it, symbols are polled one by one
+_adsSumReadBytes = getattr(pyads_ex, 'adsSumReadBytes', None)
+
+# Marker for a Symbol which has not yet reported a value
+_NO_VALUE = object()
+
+# Values of these types are compared to suppress unchanged updates
+_COMPARABLE_TYPES = (int, float, str)
+
+
 class Symbol:
+    # Attributes used on every notification come first
+    __slots__ = ('_decode', 'data_type', 'plc', '_last_value', 'symbol', 'ads',
+                 'data_size', 'array_size', 'poll_rate', 'connection',
+                 'notification_handle', '_read_request', '_subscribed')
+
+    # Report notification timestamps as datetime instead of time.time() floats
+    datetime_timestamps = False
+    # Only dispatch the latest notification per batch, dropping intermediate
+    # samples.  Suitable for display, not for edge-sensitive consumers.
+    coalesce_notifications = False
+
     def __init__(self, plc, symbol, poll_rate):
-        self._subscribed = False
+        self._decode = None
+        self.data_type = None
         self.plc = plc
+        self._last_value = _NO_VALUE
         self.symbol = symbol
-        self.connection = None
         self.ads = self.plc.ads
-        self.data_type = None
+        self.data_size = None
         self.array_size = None
-        self.notification_handle = None
         self.poll_rate = poll_rate
+        self.connection = None
+        self.notification_handle = None
+        self._read_request = None
+        self._subscribed = False
 
     def value_updated(self, timestamp, value):
         'Value update hook for subclasses'
 
-    def _notification_update(self, notification, name):
-        timestamp, value = unpack_notification(notification, self.data_type)
+    def reset_last_value(self):
+        'Report the next value even if unchanged, e.g. for a new consumer'
+        self._last_value = _NO_VALUE
+
+    def update_value(self, timestamp, value):
+        'Report a new value, skipping value_updated if a scalar is unchanged'
+        if isinstance(value, _COMPARABLE_TYPES):
+            last_value = self._last_value
+            if value is last_value or value == last_value:
+                return
+            self._last_value = value
+        else:
+            self._last_value = _NO_VALUE
         self.value_updated(timestamp, value)
 
+    def _notification_update(self, notification, name):
+        # Called from the pyads receive thread: only copy the sample out (it
+        # is released after the callback returns) and hand it off to the
+        # Plc dispatch thread for decoding.
+        contents = notification.contents
+        data = ctypes.string_at(
+            ctypes.addressof(contents) + _NOTIFICATION_DATA_OFFSET,
+            contents.cbSampleSize)
+        self.plc.add_notification(self, contents.nTimeStamp, data)
+
+    def _notification_received(self, filetime, data):
+        'Decode a notification sample queued by _notification_update'
+        if self.datetime_timestamps:
+            timestamp = pyads.filetimes.filetime_to_dt(filetime)
+        else:
+            timestamp = filetime_to_timestamp(filetime)
+        self.update_value(timestamp, self._decode(data))
+
     def _update_data_type(self):
-        self.data_type, self.array_size = get_symbol_data_type(
-            self.ads, self.symbol)
+        self.data_type, self.array_size = self.plc.get_symbol_data_type(
+            self.symbol)
+        info = self.plc.get_symbol_information(self.symbol)
+        if self.data_type is constants.PLCTYPE_STRING:
+            # PLCTYPE_STRING is a single c_char; use the declared length
+            self.data_size = info.size
+        else:
+            self.data_size = min(info.size, ctypes.sizeof(self.data_type))
+        self._decode = get_notification_decoder(self.data_type)
+        # (index group, index offset, size) for sum-up reads
+        self._read_request = (info.iGroup, info.iOffs, self.data_size)
 
     def read(self):
+        """
+        Read the current value, decoded as for notifications.
+
+        Numeric arrays are returned as read-only numpy arrays.  Returns None
+        if the connection is not open.
+        """
         if self.data_type is None:
             self._update_data_type()
-        return self.ads.read_by_name(self.symbol, plc_datatype=self.data_type)
+        data = self.ads.read_by_name(self.symbol, plc_datatype=self.data_type,
+                                     return_ctypes=True)
+        if data is None:
+            return None
+        return self._decode(bytes(data))
 
     def write(self, value):
         try:
@@ -217,10 +379,8 @@ class Symbol:
             logger.exception('Failed to write %s to %s', self.symbol, value)
 
     def _poll(self):
-        if self.data_type is None:
-            self._update_data_type()
-        value = self.ads.read_by_name(self.symbol, plc_datatype=self.data_type)
-        self.value_updated(time.time(), value)
+        value = self.read()
+        self.update_value(time.time(), value)
 
     def start(self):
         if self._subscribed:
@@ -231,7 +391,7 @@ class Symbol:
         def init():
             if self.poll_rate is None:
                 self._update_data_type()
-                attr = pyads.NotificationAttrib(ctypes.sizeof(self.data_type))
+                attr = pyads.NotificationAttrib(self.data_size)
                 self.notification_handle = self.ads.add_device_notification(
                     self.symbol, attr, self._notification_update)
             else:
@@ -239,111 +399,328 @@ class Symbol:
 
         self.plc.add_to_queue(init)
         if self.poll_rate is not None:
-            self.plc.add_to_poll_thread(self.poll_rate, self._poll)
+            self.plc.add_to_poll_thread(self.poll_rate, self)
 
     def stop(self):
         if not self._subscribed:
             return
 
-        self.plc.stop_polling(self.poll_rate, self._poll)
+        self.plc.stop_polling(self.poll_rate, self)
         handle = self.notification_handle
         if self.poll_rate is None and handle is not None:
             self.notification_handle = None
             self.ads.del_device_notification(*handle)
 
         self._subscribed = False
+        self._last_value = _NO_VALUE
 
 
 class Plc:
+    # Period (in seconds) at which batched notifications are dispatched
+    dispatch_period = 0.033
+
     def __init__(self, ip_address, ams_id, port):
         self.running = True
         self.ip_address = ip_address
         self.ams_id = ams_id
         self.port = port
         self.symbols = {}
+        self._symbols_lock = threading.Lock()
+        # symbol name -> (info, data_type, array_length), valid for this
+        # connection
+        self._type_cache = {}
         self.ads = pyads.Connection(ams_id, port, ip_address=ip_address)
-        self.queue = queue.Queue()
+        self.queue = collections.deque()
+        self._queue_wake = threading.Event()
         self.thread = threading.Thread(target=self._thread, daemon=True)
         self.thread.start()
-        self.poll_threads = {}
+        # poll rate -> tuple of symbols polled at that rate.  These are
+        # replaced rather than mutated, so the poll thread can iterate over
+        # them without a copy.
+        self.poll_rates = {}
+        # min-heap of (next poll time, poll rate), shared by all rates
+        self._poll_schedule = []
+        self._poll_lock = threading.Lock()
+        self._poll_wake = threading.Event()
+        self._sum_read_failing = False
+        self.poll_thread = threading.Thread(target=self._poll_thread,
+                                            daemon=True)
+        self.poll_thread.start()
+        # symbol -> latest undispatched (filetime, data) sample, for
+        # symbols which coalesce notifications
+        self.notifications = {}
+        # (symbol, filetime, data) for all other symbols, in order
+        self.notification_queue = collections.deque()
+        self._dispatch_wake = threading.Event()
+        self.dispatch_thread = threading.Thread(target=self._dispatch_thread,
+                                                daemon=True)
+        self.dispatch_thread.start()
+
+    def stop_polling(self, rate, symbol):
+        with self._poll_lock:
+            symbols = self.poll_rates.get(rate, ())
+            if symbol not in symbols:
+                return
+
+            symbols = tuple(sym for sym in symbols if sym is not symbol)
+            if symbols:
+                self.poll_rates[rate] = symbols
+                return
+
+            # Last symbol at this rate: stop scheduling it
+            del self.poll_rates[rate]
+            self._poll_schedule[:] = [item for item in self._poll_schedule
+                                      if item[1] != rate]
+            heapq.heapify(self._poll_schedule)
+
+    def add_to_poll_thread(self, rate, symbol):
+        with self._poll_lock:
+            if rate not in self.poll_rates:
+                heapq.heappush(self._poll_schedule,
+                               (time.monotonic() + rate, rate))
+                self._poll_wake.set()
+
+            symbols = self.poll_rates.get(rate, ())
+            self.poll_rates[rate] = symbols + (symbol, )
+
+    def stop(self):
+        self.running = False
+        self._poll_wake.set()
+        self._dispatch_wake.set()
+        self._type_cache.clear()
+        self.add_to_queue(lambda: None)
 
-    def stop_polling(self, rate, func, *args, **kwargs):
-        if rate not in self.poll_threads:
+    def add_notification(self, symbol, filetime, data):
+        'Queue a raw notification sample for the next dispatch batch'
+        if symbol.coalesce_notifications:
+            # Replaces any undispatched sample from the same symbol
+            self.notifications[symbol] = (filetime, data)
+        else:
+            self.notification_queue.append((symbol, filetime, data))
+        self._dispatch_wake.set()
+
+    def add_to_queue(self, func, *args, **kwargs):
+        self.queue.append((func, args, kwargs))
+        self._queue_wake.set()
+
+    def _poll_symbol(self, rate, symbol):
+        'Poll a single symbol, dropping it on failure'
+        try:
+            symbol._poll()
+        except Exception:
+            logger.exception(
+                'Poll thread %s:%s:%d @ %.3f sec failure: %s',
+                self.ip_address, self.ams_id, self.port,
+                rate, symbol.symbol
+            )
+            self.stop_polling(rate, symbol)
+
+    def _poll_thread(self):
+        schedule = self._poll_schedule
+        while self.running:
+            self._poll_wake.clear()
+            with self._poll_lock:
+                next_poll, rate = schedule[0] if schedule else (None, None)
+
+            if next_poll is None:
+                self._poll_wake.wait()
+                continue
+
+            now = time.monotonic()
+            if next_poll > now:
+                # Sleep until the nearest deadline or a new poll rate
+                self._poll_wake.wait(next_poll - now)
+                continue
+
+            with self._poll_lock:
+                if not schedule or schedule[0] != (next_poll, rate):
+                    # The rate was removed in the meantime
+                    continue
+                # Do not try to catch up on missed polls
+                heapq.heapreplace(schedule, (max(next_poll + rate, now), rate))
+
+            self._poll_rate(rate)
+
+    def _poll_rate(self, rate):
+        'Poll all symbols at the given rate'
+        with self._poll_lock:
+            symbols = self.poll_rates.get(rate, ())
+
+        if not symbols or not self.ads.is_open:
             return
 
-        # TODO cid
-        self.poll_threads[rate]['calls'].remove((func, args, kwargs))
+        resolved = []
+        for symbol in symbols:
+            if symbol._read_request is None or _adsSumReadBytes is None:
+                # The first read resolves the data type and read request
+                self._poll_symbol(rate, symbol)
+            else:
+                resolved.append(symbol)
 
-    def add_to_poll_thread(self, rate, func, *args, **kwargs):
-        if rate not in self.poll_threads:
-            thread = threading.Thread(target=self._poll_thread, args=(rate, ),
-                                      daemon=True)
-            self.poll_threads[rate] = dict(thread=thread, calls=[])
-            thread.start()
+        for start in range(0, len(resolved), _SUM_READ_MAX):
+            batch = resolved[start:start + _SUM_READ_MAX]
+            try:
+                self._sum_read(rate, batch)
+            except Exception:
+                # Log only the first of consecutive failures (e.g., the PLC
+                # is unreachable), rather than once per batch per tick
+                log = logger.debug if self._sum_read_failing else \
+                    logger.exception
+                self._sum_read_failing = True
+                log('Poll thread %s:%s:%d @ %.3f sec sum-up read of %d '
+                    'symbols failed',
+                    self.ip_address, self.ams_id, self.port, rate,
+                    len(batch), exc_info=True)
+            else:
+                if self._sum_read_failing:
+                    logger.info('Poll thread %s:%s:%d sum-up reads recovered',
+                                self.ip_address, self.ams_id, self.port)
+                self._sum_read_failing = False
+
+    def _read_sum_bytes(self, requests):
+        """
+        Raw ADS sum-up read of (index group, index offset, size) requests.
+
+        Returns the per-request error codes followed by the data of each
+        request.  This uses `pyads_ex.adsSumReadBytes` and the AMS port and
+        address of the pyads Connection, which are pyads internals; it
+        requires pyads 3.3.9 or newer.
+        """
+        return bytes(_adsSumReadBytes(self.ads._port, self.ads._adr,
+                                      requests))
+
+    def _sum_read(self, rate, symbols):
+        'Read symbols in one ADS sum-up request, dropping any that fail'
+        response = self._read_sum_bytes(
+            [symbol._read_request for symbol in symbols])
+        timestamp = time.time()
+
+        # Response: one error code per symbol, followed by the data of each
+        data_offset = _SUM_READ_ERROR.size * len(symbols)
+        for idx, symbol in enumerate(symbols):
+            size = symbol._read_request[2]
+            data = response[data_offset:data_offset + size]
+            data_offset += size
+            error, = _SUM_READ_ERROR.unpack_from(
+                response, _SUM_READ_ERROR.size * idx)
+            try:
+                if error:
+                    raise pyads.ADSError(error)
+                symbol.update_value(timestamp, symbol._decode(data))
+            except Exception:
+                logger.exception(
+                    'Poll thread %s:%s:%d @ %.3f sec failure: %s',
+                    self.ip_address, self.ams_id, self.port,
+                    rate, symbol.symbol
+                )
+                self.stop_polling(rate, symbol)
+
+    def _dispatch_notification(self, symbol, filetime, data):
+        if not symbol._subscribed:
+            # Sample from before the symbol was stopped
+            return
 
-        self.poll_threads[rate]['calls'].append((func, args, kwargs))
+        try:
+            symbol._notification_received(filetime, data)
+        except Exception:
+            logger.exception(
+                'Dispatch thread %s:%s:%d failure: %s',
+                self.ip_address, self.ams_id, self.port, symbol.symbol
+            )
+
+    def _dispatch_thread(self):
+        latest = self.notifications
+        queue = self.notification_queue
+        while self.running:
+            self._dispatch_wake.wait()
+            # Let a batch of notifications accumulate
+            time.sleep(self.dispatch_period)
+            self._dispatch_wake.clear()
 
-    def stop(self):
-        self.running = False
-        self.add_to_queue(lambda: None)
+            while queue:
+                self._dispatch_notification(*queue.popleft())
 
-    def add_to_queue(self, func, *args, **kwargs):
-        self.queue.put((func, args, kwargs))
+            while latest:
+                symbol, (filetime, data) = latest.popitem()
+                self._dispatch_notification(symbol, filetime, data)
 
-    def _poll_thread(self, rate):
+    def _thread(self):
+        queue = self.queue
         while self.running:
-            info = self.poll_threads[rate]
-            t0 = time.time()
-            for item in list(info['calls']):
-                func, args, kwargs = item
+            self._queue_wake.wait()
+            self._queue_wake.clear()
+            while queue:
+                func, args, kwargs = queue.popleft()
                 try:
                     func(*args, **kwargs)
                 except Exception:
                     logger.exception(
-                        'Poll thread %s:%s:%d @ %.3f sec failure: '
-                        '%s(*%r, **%r)',
+                        'PLC thread %s:%s:%d failure: %s(*%r, **%r)',
                         self.ip_address, self.ams_id, self.port,
-                        rate, func.__name__, args, kwargs
+                        func.__name__, args, kwargs
                     )
-                    info['calls'].remove(item)
-            elapsed = time.time() - t0
-            time.sleep(max((0, rate - elapsed)))
-
-    def _thread(self):
-        while self.running:
-            func, args, kwargs = self.queue.get()
-            try:
-                func(*args, **kwargs)
-            except Exception:
-                logger.exception('PLC thread %s:%s:%d failure: %s(*%r, **%r)',
-                                 self.ip_address, self.ams_id, self.port,
-                                 func.__name__, args, kwargs)
         self.ads.close()
 
+    def _get_symbol_type_info(self, symbol_name):
+        try:
+            return self._type_cache[symbol_name]
+        except KeyError:
+            info = get_symbol_information(self.ads, symbol_name)
+            data_type, array_length = get_symbol_data_type(
+                self.ads, symbol_name, info=info)
+            result = (info, data_type, array_length)
+            self._type_cache[symbol_name] = result
+            return result
+
+    def get_symbol_information(self, symbol_name):
+        'Get the SAdsSymbolEntry for a symbol, caching the result'
+        info, _, _ = self._get_symbol_type_info(symbol_name)
+        return info
+
+    def get_symbol_data_type(self, symbol_name):
+        'Get (data_type, array_length) for a symbol, caching the result'
+        _, data_type, array_length = self._get_symbol_type_info(symbol_name)
+        return data_type, array_length
+
     def clear_symbol(self, symbol):
-        _ = self.symbols.pop(symbol)
-        if not self.symbols:
-            self.ads.close()
+        with self._symbols_lock:
+            _ = self.symbols.pop(symbol)
+            if not self.symbols:
+                self.ads.close()
 
     def get_symbol(self, symbol_name, poll_rate, *, cls=Symbol):
         key = (symbol_name, poll_rate, cls)
-        try:
-            return self.symbols[key]
-        except KeyError:
-            if not self.ads.is_open:
-                self.ads.open()
-            self.symbols[key] = cls(self, symbol_name, poll_rate)
-            return self.symbols[key]
+        symbol = self.symbols.get(key)
+        if symbol is not None:
+            return symbol
+
+        with self._symbols_lock:
+            # Another thread may have created it while waiting on the lock
+            symbol = self.symbols.get(key)
+            if symbol is None:
+                if not self.ads.is_open:
+                    self._type_cache.clear()
+                    self.ads.open()
+                symbol = cls(self, symbol_name, poll_rate)
+                self.symbols[key] = symbol
+            return symbol
 
 
 _PLCS = {}
+# Per-PLC construction locks, so only one Plc (and its threads) is created
+_PLC_LOCKS = collections.defaultdict(threading.Lock)
 
 
 def get_connection(ip_address, ams_id, port):
     key = (ip_address, ams_id, port)
-    try:
-        return _PLCS[key]
-    except KeyError:
-        plc = Plc(ip_address, ams_id, port)
-        _PLCS[key] = plc
+    plc = _PLCS.get(key)
+    if plc is not None:
+        return plc
+
+    with _PLC_LOCKS[key]:
+        # Another thread may have created it while waiting on the lock
+        plc = _PLCS.get(key)
+        if plc is None:
+            plc = Plc(ip_address, ams_id, port)
+            _PLCS[key] = plc
         return plc
@@ -11,6 +11,8 @@ logger = logging.getLogger(__name__)
 
 
 class _SignalSymbol(Symbol):
+    __slots__ = ('callbacks', 'update_hook')
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.callbacks = []
@@ -95,6 +97,8 @@ class AdsSignal(Signal):
 
         if not self._subscribed and event_type in {'value', 'meta'}:
             self._symbol.callbacks.append(self._value_changed)
+            # The symbol may already be running and its value unchanged
+            self._symbol.reset_last_value()
             self._symbol.start()
             self._subscribed = True
 
@@ -1,3 +1,20 @@
+import functools
+import re
+
+
+# Fast path for the common address forms: ip_address or ams_id (ending in
+# .1.1) hosts, numeric port and poll rate.  Anything else goes through
+# `_parse_address_fallback`.
+_ADDRESS_RE = re.compile(
+    r'^(?:ads:/*)?'
+    r'(?P<host>(?P<ams_id>\d+(?:\.\d+){3}\.1\.1)'
+    r'|(?P<ip_address>\d+(?:\.\d+){3}))'
+    r'(?::(?P<port>\d+))?/'
+    r'(?:@(?P<poll_rate>[\d.]+)/)?'
+    r'(?P<symbol>[^@].*)\Z'
+)
+
+
 def parse_address(addr, *, allow_macros=False):
     '''
     ads://<host>[:<port>][/@poll_rate]/<symbol>
@@ -7,6 +24,34 @@ def parse_address(addr, *, allow_macros=False):
         ams_id
         ams_id@ip_address
     '''
+    return dict(_parse_address(addr, allow_macros))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_address(addr, allow_macros):
+    match = _ADDRESS_RE.match(addr)
+    if match is None:
+        return _parse_address_fallback(addr, allow_macros=allow_macros)
+
+    ams_id = match['ams_id']
+    if ams_id is not None:
+        ip_address = ams_id[:-4]
+    else:
+        ip_address = match['ip_address']
+        ams_id = '{}.1.1'.format(ip_address)
+
+    port = match['port']
+    poll_rate = match['poll_rate']
+    return {'ip_address': ip_address,
+            'host': match['host'],
+            'ams_id': ams_id,
+            'port': 851 if port is None else int(port),
+            'poll_rate': None if poll_rate is None else float(poll_rate),
+            'symbol': match['symbol'],
+            }
+
+
+def _parse_address_fallback(addr, *, allow_macros=False):
     if addr.startswith('ads:'):
         addr = addr[4:].lstrip('/')
 
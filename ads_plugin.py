@@ -13,6 +13,11 @@ logger = logging.getLogger(__name__)
 
 
 class SymbolForPydm(Symbol):
+    __slots__ = ('data', 'pydm_connection')
+
+    # Widgets only need the latest value per update
+    coalesce_notifications = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.data = {'CONNECTION': False}
@@ -28,6 +33,8 @@ class SymbolForPydm(Symbol):
 
     def set_connection(self, pydm_connection):
         self.pydm_connection = pydm_connection
+        # The symbol may already be running and its value unchanged
+        self.reset_last_value()
         self.start()
 
 